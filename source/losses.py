@@ -38,6 +38,12 @@ def compute_reprojection_error(x,S,A,show=False,loss='l2'):
 
     return error
 
+# compile the reprojection path - it is a long chain of small pointwise & linear-algebra ops that
+# TorchInductor can fuse into far fewer kernel launches; shapes are static per training run so it
+# compiles once (no-op on PyTorch versions without torch.compile)
+if hasattr(torch, 'compile'):
+    compute_reprojection_error = torch.compile(compute_reprojection_error, dynamic=False)
+
 # batched reprojection error using intrinsics and extrinsics on world coordinates
 #
 #INPUT:
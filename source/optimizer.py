@@ -816,8 +816,13 @@ class Optimizer():
 
     def save(self,token=''):
         print("saving!")
-        torch.save(self.calib_net.state_dict(),self.model_path + os.sep + token + 'calib_net.pt')
-        torch.save(self.sfm_net.state_dict(),self.model_path + os.sep + token + 'sfm_net.pt')
+        # torch.compile wraps the nets in OptimizedModules whose state dicts prefix every key
+        # with '_orig_mod.' - save the underlying modules so the checkpoints stay loadable
+        # into plain PointNets (load() and wet_test load them that way)
+        calib_net = getattr(self.calib_net, '_orig_mod', self.calib_net)
+        sfm_net = getattr(self.sfm_net, '_orig_mod', self.sfm_net)
+        torch.save(calib_net.state_dict(),self.model_path + os.sep + token + 'calib_net.pt')
+        torch.save(sfm_net.state_dict(),self.model_path + os.sep + token + 'sfm_net.pt')
 
     # load network from directory
     def load(self, token=''):
@@ -1,9 +1,8 @@
 import os
 import sys
-import time
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from itertools import product
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import torch
@@ -11,6 +10,13 @@ from numpy.typing import NDArray
 from optimizer import Optimizer
 from torch.utils.tensorboard import SummaryWriter
 
+# optuna is optional - when it is not installed the hyperparameter search falls back to the
+# exhaustive grid
+try:
+    import optuna
+except ImportError:
+    optuna = None
+
 # mapping between dlib landmark indexes (list index) and Face Blaze landmark index (list value)
 DLIB_2_FACE_BLAZE_MAPPING = [
     # face outline
@@ -89,18 +95,28 @@ DLIB_2_FACE_BLAZE_MAPPING = [
     87,
 ]
 
+# index-array form of the mapping above - lets NumPy run the 68-landmark gather as a single
+# C-level fancy-indexing op instead of a per-landmark Python list comprehension; frozen so no
+# caller can accidentally corrupt the shared constant
+_DLIB_MAPPING_IDX = np.asarray(DLIB_2_FACE_BLAZE_MAPPING, dtype=np.intp)
+_DLIB_MAPPING_IDX.setflags(write=False)
+assert _DLIB_MAPPING_IDX.shape == (68,)
+
 # NOTE: Keypoints on few of the captured frames seem a little off, so we don't take those frames into account in calculations.
 VALID_FRAME_INDEXES_DATA_1 = [1, 2, 3, 4, 5, 6, 7, 8, 9]
 
 
-def load_wet_data(test_data: str) -> Tuple[List[NDArray[np.uint8]], List[NDArray[np.float32]]]:
+def load_wet_data(test_data: str) -> NDArray[np.float32]:
     """Loads data dumped using face keypoint extraction script
 
+    NOTE: only the keypoints are materialized - the frame payloads (the bulk of every file) are
+    never read, their npy headers are parsed just to seek past them and to report the frame size
+
     Arguments:
         test_data: tag of the test data that is used during tests
 
     Returns:
-        list of frames & list of dlib's keypoints related to those frames
+        dlib's keypoints of all frames as an array of shape (N, 68, 2)
     """
 
     assert test_data in ['kjduzink_laptop', 'kjduzink_phone', 'jglinko_phone', 'askrzyne_phone']
@@ -121,7 +137,6 @@ def load_wet_data(test_data: str) -> Tuple[List[NDArray[np.uint8]], List[NDArray
         DATA_FOLDER = 'data5'
         VALID_FRAME_INDEXES = [i for i in range(100)]
 
-    frames = []
     face_blaze_keypoints_list = []
 
     width = None
@@ -130,32 +145,42 @@ def load_wet_data(test_data: str) -> Tuple[List[NDArray[np.uint8]], List[NDArray
     assert DATA_FOLDER
     assert VALID_FRAME_INDEXES
 
+    # normalize the data directory once instead of re-normalizing the full path per frame
+    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), f'../wet/{DATA_FOLDER}'))
+
     for i in VALID_FRAME_INDEXES:
-        filepath = os.path.abspath(os.path.abspath(os.path.join(os.path.dirname(__file__), f'../wet/{DATA_FOLDER}/frame_kpts_{i}.npy')))
+        filepath = os.path.join(base_dir, f'frame_kpts_{i}.npy')
 
         with open(filepath, 'rb') as f:
-            frame = np.load(f)
+            # parse only the npy header of the frame array and seek past its payload - the
+            # keypoints that follow are a tiny fraction of the file
+            version = np.lib.format.read_magic(f)
+            read_header = (np.lib.format.read_array_header_1_0 if version == (1, 0)
+                           else np.lib.format.read_array_header_2_0)
+            frame_shape, _, frame_dtype = read_header(f)
+            f.seek(int(np.prod(frame_shape)) * frame_dtype.itemsize, os.SEEK_CUR)
+
             face_keypoints = np.load(f)
 
-        if i == 0:
-            width = frame.shape[1]
-            height = frame.shape[0]
+        if width is None:
+            width = frame_shape[1]
+            height = frame_shape[0]
 
-        frames.append(frame)
         face_blaze_keypoints_list.append(face_keypoints)
 
     print(f'Loaded frames count: {len(face_blaze_keypoints_list)}')
     print(f'Frame width: {width}, height: {height} [pixels]')
 
-    # go through keypoint list and extract a subset of 68 used by the FaceCalibration
+    # extract the subset of 68 landmarks used by the FaceCalibration for all frames at once
     # based on https://github.com/google/mediapipe/blob/a908d668c730da128dfa8d9f6bd25d519d006692/mediapipe/modules/face_geometry/data/canonical_face_model_uv_visualization.png
     # NOTE: landmarks used by FaceCalibration are in fact dlib's face detector keypoints
+    # NOTE: stacking first lets one batched fancy-indexing op replace the per-frame
+    #       face_blaze_2_dlib_2d calls (no coordinate flip is applied here, as before)
+    fb_stack = np.stack(face_blaze_keypoints_list).astype(np.float32, copy=False)
+    assert fb_stack.shape[1:] == (478, 2)
+    dlib_keypoints = fb_stack[:, _DLIB_MAPPING_IDX, :]
 
-    dlib_keypoints_list = []
-    for single_frame_face_keypoints in face_blaze_keypoints_list:
-        dlib_keypoints_list.append(face_blaze_2_dlib_2d(single_frame_face_keypoints, width=width, height=height))
-
-    return frames, dlib_keypoints_list
+    return dlib_keypoints
 
 
 def face_blaze_2_dlib_2d(fb_landmarks: NDArray[np.float32], width:int = 640, height: int = 480, flip_coordinates: bool = False) -> NDArray[np.float32]:
@@ -175,13 +200,13 @@ def face_blaze_2_dlib_2d(fb_landmarks: NDArray[np.float32], width:int = 640, hei
 
     assert len(DLIB_2_FACE_BLAZE_MAPPING) == 68
 
-    # extract dlib's landmarks from Face Blaze landmarks
-    dlib_landmarks = np.array([fb_landmarks[i] for i in DLIB_2_FACE_BLAZE_MAPPING], dtype=np.float32)
+    # extract dlib's landmarks from Face Blaze landmarks - a single vectorized gather
+    dlib_landmarks = fb_landmarks[_DLIB_MAPPING_IDX].astype(np.float32, copy=False)
 
     if flip_coordinates:
-        # convert coordinate system to match how the FaceCalibration optimizer was trained
-        dlib_landmarks[:, 0] = width - dlib_landmarks[:, 0]
-        dlib_landmarks[:, 1] = height - dlib_landmarks[:, 1]
+        # convert coordinate system to match how the FaceCalibration optimizer was trained - one
+        # broadcasted subtract flips both columns at once
+        dlib_landmarks = np.array([width, height], dtype=np.float32) - dlib_landmarks
     assert dlib_landmarks.shape == (68, 2)
 
     return dlib_landmarks
@@ -202,17 +227,18 @@ def load_gt_camera_parameters(test_data: str) -> NDArray[np.float32]:
 
     filepath = None
     if test_data == 'kjduzink_laptop':
-        filepath = os.path.abspath(os.path.abspath(os.path.join(os.path.dirname(__file__), '../wet/asus_tuf_f15_calibration.npz')))
+        filepath = os.path.abspath(os.path.join(os.path.dirname(__file__), '../wet/asus_tuf_f15_calibration.npz'))
     elif test_data == 'kjduzink_phone':
-        filepath = os.path.abspath(os.path.abspath(os.path.join(os.path.dirname(__file__), '../wet/oppo_reno_6_5g_calibration.npz')))
+        filepath = os.path.abspath(os.path.join(os.path.dirname(__file__), '../wet/oppo_reno_6_5g_calibration.npz'))
     elif test_data == 'jglinko_phone':
-        filepath = os.path.abspath(os.path.abspath(os.path.join(os.path.dirname(__file__), '../wet/samsung_s10e_calibration.npz')))
+        filepath = os.path.abspath(os.path.join(os.path.dirname(__file__), '../wet/samsung_s10e_calibration.npz'))
     elif test_data == 'askrzyne_phone':
-        filepath = os.path.abspath(os.path.abspath(os.path.join(os.path.dirname(__file__), '../wet/huawei_p30_calibration.npz')))
+        filepath = os.path.abspath(os.path.join(os.path.dirname(__file__), '../wet/huawei_p30_calibration.npz'))
 
     assert filepath
-    with open(filepath, 'rb') as f:
-        npz_file = np.load(f, allow_pickle=True)
+    # the file holds plain ndarrays only, so allow_pickle stays off (faster and safer); the
+    # context manager closes the underlying zipfile right away instead of leaving it to the GC
+    with np.load(filepath, allow_pickle=False) as npz_file:
         legacy_camera_matrix = npz_file['camera_matrix']
         # legacy_camera_distortion = npz_file['camera_distortion']
         # legacy_reprojection_error = npz_file['reprojection_error']
@@ -226,39 +252,238 @@ def load_gt_camera_parameters(test_data: str) -> NDArray[np.float32]:
     return legacy_camera_matrix
 
 
-def convert_keypoints_list_to_tensor(keypoints_list: List[NDArray[np.float32]]) -> torch.Tensor:
-    """Convert list of face keypoints as NumPy arrays to torch tensor, to match input type
+def convert_keypoints_list_to_tensor(keypoints_list: Union[List[NDArray[np.float32]], NDArray[np.float32]],
+                                     device: Optional[torch.device] = None) -> torch.Tensor:
+    """Convert face keypoints as NumPy arrays to torch tensor, to match input type
     of FaceCalibration NN
 
     Args:
-        keypoints_list: list of NumPy arrays corresponding to dlib keypoints identified in input data
+        keypoints_list: dlib keypoints identified in input data, either as an already-stacked
+            array of shape (N, 68, 2) or a list of per-frame (68, 2) arrays
+        device: target device for the tensor; None keeps it on the CPU (where the pre-trained
+            nets currently live)
 
     Returns:
         torch tensor of shape (N, 2, 68)
     """
 
-    assert isinstance(keypoints_list, list)
-    assert all([isinstance(single_frame_keypoints, np.ndarray) and len(single_frame_keypoints.shape) == 2 and single_frame_keypoints.shape[0] == 68 for single_frame_keypoints in keypoints_list])
-
-    # convert list of NumPy arrays to NumPy array
-    keypoints = np.array(keypoints_list)
+    if isinstance(keypoints_list, np.ndarray):
+        # fast path for already-stacked keypoints, e.g. straight from load_wet_data
+        keypoints = keypoints_list.astype(np.float32, copy=False)
+    else:
+        assert isinstance(keypoints_list, list)
+        assert all([isinstance(single_frame_keypoints, np.ndarray) and len(single_frame_keypoints.shape) == 2 and single_frame_keypoints.shape[0] == 68 for single_frame_keypoints in keypoints_list])
+        keypoints = np.stack(keypoints_list).astype(np.float32, copy=False)
+    assert len(keypoints.shape) == 3 and keypoints.shape[1] == 68 and keypoints.shape[2] == 2
+
+    # transpose into the FaceCalibration input format (N, 2, 68) - ascontiguousarray materializes
+    # the transposed layout here, so torch gets a contiguous float32 block instead of a swapaxes
+    # view it would have to copy later anyway
     print(f'keypoints.shape: {keypoints.shape}')
-
-    # reorder axis order to match FaceCalibration input format (N, 2, 68)
-    keypoints = np.swapaxes(keypoints, 1, 2)
+    keypoints = np.ascontiguousarray(keypoints.transpose(0, 2, 1))
     assert len(keypoints.shape) == 3 and keypoints.shape[1] == 2 and keypoints.shape[2] == 68
 
-    # convert to torch tensor
+    # convert to torch tensor - zero-copy wrap of the contiguous array
     keypoints = torch.from_numpy(keypoints)
 
-    # TODO: Do we need to move this to CUDA or not?
-    # move tensor to CUDA
-    # keypoints = keypoints.cuda()
+    # move the tensor to the requested device once here so the optimizer never pays per-iteration
+    # host-to-device copies; pinning first makes the single transfer asynchronous
+    if device is not None and torch.device(device).type == 'cuda':
+        assert torch.cuda.is_available()
+        keypoints = keypoints.pin_memory().to(device, non_blocking=True)
     print(f'keypoints.device: {keypoints.device}')
 
     return keypoints
 
 
+def _init_grid_worker():
+    # the grid runs as many worker processes as there are cores - letting each of them also
+    # spawn a full intra-op thread pool would just oversubscribe the CPU
+    torch.set_num_threads(1)
+
+
+def evaluate_predictions(K: torch.Tensor, f_gt: float) -> float:
+    """Averages the per-frame intrinsic predictions and scores them against the ground truth.
+
+    Args:
+        K: (N, 3, 3) tensor of predicted camera matrices (one per processed frame)
+        f_gt: ground truth focal length
+
+    Returns:
+        Relative focal length error of the averaged prediction.
+    """
+    # get predicted camera's intrinsics by averaging predictions based on all processed data
+    # frames - a single fused reduction over the (N, 3, 3) stack and one tiny transfer instead
+    # of a separate mean per matrix entry
+    K_mean = K.detach().mean(dim=0).cpu().numpy()
+    f = K_mean[0, 0]
+    px = K_mean[0, 2]
+    py = K_mean[1, 2]
+
+    # get final prediction of camera matrix
+    K_avg = np.array([
+        [f, 0.0, px],
+        [0.0, f, py],
+        [0.0, 0.0, 1.0]
+    ])
+
+    print(f'K_avg:\n{K_avg}')
+
+    # compare with what was calculated based on legacy camera calibration procedure using checkerboard
+    f_error = abs(f - f_gt) / f_gt
+    print(f'f_error: {f_error:.03f}')
+
+    return f_error
+
+
+def run_one(run_id: int,
+            calib_lr: float,
+            sfm_lr: float,
+            global_iter_count: int,
+            calib_iter_count: int,
+            sfm_iter_count: int,
+            face_keypoints_tensor: torch.Tensor,
+            f_gt: float,
+            center: torch.Tensor,
+            token_states: List[Tuple[Dict[str, torch.Tensor], Dict[str, torch.Tensor]]],
+            use_optimization: bool = False) -> Dict[str, Any]:
+    """Evaluates a single hyperparameter combination of the grid search.
+
+    The combinations are fully independent, so this function is designed to run in a worker
+    process - each run writes its results to its own comment-tagged TensorBoard log dir.
+
+    Args:
+        run_id: index of the hyperparameter combination (used to tag the TensorBoard run)
+        calib_lr: learning rate of the K calibration net optimizer
+        sfm_lr: learning rate of the head pose estimation net optimizer
+        global_iter_count: number of global iterations of the dual-optimization
+        calib_iter_count: number of calibration iterations per global iteration
+        sfm_iter_count: number of SfM iterations per global iteration
+        face_keypoints_tensor: (N, 2, 68) tensor of detected 2D face landmarks
+        f_gt: ground truth focal length (for error calculation only)
+        center: hardcoded principal point
+        token_states: (sfm_net state dict, calib_net state dict) pair per pre-trained token -
+            every token is evaluated with this hyperparameter combination
+        use_optimization: whether to run the dual-optimization or just the pre-trained nets
+
+    Returns:
+        Dictionary with the hyperparameters of the run and the best 'f_error' achieved across
+        the tokens (None if every token failed).
+    """
+    # instantiate TensorBoard's SummaryWriter object to track training progress
+    # NOTE: no hand-rolled timestamp in the comment - SummaryWriter already prefixes its default
+    #       log dir with the current datetime, and run_id keeps concurrent runs unique even when
+    #       workers start within the same second
+    comment = f'{run_id}_wet_test_calib_lr={calib_lr:.06f},sfm_lr={sfm_lr:.06f}_gi={global_iter_count}_ci={calib_iter_count}_si={sfm_iter_count}'
+    writer = SummaryWriter(comment=comment)
+
+    # initialize FaceCalibration's optimizer
+    # NOTE: 'gt' is a dictionary that holds ground truth camera matrix & ground truth 3D face landmark locations.
+    #       It's only used for error calculation so you can pass an empty dict and still run optimization algorithm
+
+    optim = Optimizer(center, gt={}, calib_lr=calib_lr, sfm_lr=sfm_lr, tb_writer=writer)
+    assert optim is not None
+
+    # run FaceCalibration's optimizer to get camera matrix (K) and face location (S) prediction
+
+    # default used in paper
+    # SFM_LR = 6
+
+    # # experimental values
+    # # SFM_LR = 0.01
+    # SFM_LR = 0.001  # according to best training on TensorBoard
+    # CALIB_LR = 0.001  # according to best training on TensorBoard
+
+    # number of iterations for dual-optimization
+    # MAX_ITER = 25
+
+    result = {
+        'run_id': run_id,
+        'calib_lr': calib_lr,
+        'sfm_lr': sfm_lr,
+        'global_iter_count': global_iter_count,
+        'calib_iter_count': calib_iter_count,
+        'sfm_iter_count': sfm_iter_count,
+        'f_error': None,
+    }
+
+    # evaluate every pre-trained token with this hyperparameter combination within one Optimizer
+    # lifecycle - amortizes the grid search across the models instead of requiring a full re-run
+    # per PRE_TRAINED_MODEL_INDEX
+    for token_index, (sfm_state, calib_state) in enumerate(token_states):
+        # load pre-trained weights from the state dicts read once in main() - unlike
+        # Optimizer.load() this does not touch the disk again
+        optim.sfm_net.load_state_dict(sfm_state)
+        optim.calib_net.load_state_dict(calib_state)
+
+        # fresh Adam moments per token, keeping the learning rates of this grid run in effect
+        # (Optimizer.load() would reset them to hardcoded values)
+        optim.sfm_opt = torch.optim.Adam(optim.sfm_net.parameters(), lr=sfm_lr)
+        optim.calib_opt = torch.optim.Adam(optim.calib_net.parameters(), lr=calib_lr)
+
+        if use_optimization:
+            # optimize using Alternating Optimization (AO) approach - proven to be the best one according to paper
+
+            # TODO: Subject for removal
+            # set learning rate for optimizers
+            # optim.sfm_opt.param_groups[0]['lr'] = SFM_LR
+            # optim.calib_opt.param_groups[0]['lr'] = CALIB_LR
+
+            try:
+                S, K, R, T = optim.dualoptimization(
+                    face_keypoints_tensor,
+                    global_iter_count=global_iter_count,
+                    calib_iter_count=calib_iter_count,
+                    sfm_iter_count=sfm_iter_count
+                )
+            except (RuntimeError, ValueError, FloatingPointError) as e:
+                # NOTE: torch.linalg.LinAlgError subclasses RuntimeError, so singular-matrix and
+                #       other numerical failures land here; KeyboardInterrupt/SystemExit are no
+                #       longer swallowed, so a stuck grid can actually be killed
+                print(f'run {run_id}, token {token_index}: optimization failed: {e}')
+                continue
+
+            # TODO: verify if other optimization methods give better results
+            # # JO approach
+            # S,K,R,T = optim.jointoptimization(face_keypoints_tensor, max_iter=100)
+
+            # # SO approach
+            # S,K,R,T = optim.sequentialoptimization(face_keypoints_tensor)
+
+            # AO approach
+            # S, K, R, T = optim.dualoptimization(face_keypoints_tensor, max_iter=5)
+
+        else:
+            # run without optimization
+            K = optim.predict_intrinsic(face_keypoints_tensor)
+            assert len(K.shape) == 3 and K.shape[0] == face_keypoints_tensor.shape[0] and K.shape[1:] == (3, 3)
+            S = optim.get_shape(face_keypoints_tensor)
+            assert len(S.shape) == 3 and S.shape[0] == face_keypoints_tensor.shape[0] and S.shape[1:] == (68, 3)
+
+        f_error = evaluate_predictions(K, f_gt)
+
+        writer.add_hparams(
+                {
+                    'calib_lr': calib_lr,
+                    'sfm_lr': sfm_lr,
+                    'global_iter_count': global_iter_count,
+                    'calib_iter_count': calib_iter_count,
+                    'sfm_iter_count': sfm_iter_count,
+                    'token': token_index,
+                },
+                {
+                    'f_error': f_error,
+                },
+                run_name=f'token_{token_index}'
+            )
+
+        if result['f_error'] is None or f_error < result['f_error']:
+            result['f_error'] = f_error
+
+    writer.close()
+    return result
+
+
 def main():
     print('*** FaceCalibration test on WET data ***')
 
@@ -302,137 +527,139 @@ def main():
     hparam_values = [v for v in hparameters.values()]
     print(hparam_values)
 
-    # test various settings of the optimizers to see what gives the best results on real data from a phone
-    # go through all permutations of the hyper parameters
-    for run_id, (calib_lr, sfm_lr, global_iter_count, calib_iter_count, sfm_iter_count) in enumerate(product(*hparam_values)):
-
-        # get current timestamp tag
-        date_time = datetime.fromtimestamp(time.time(), tz=None)
-        timestamp_tag = date_time.strftime("%d-%m-%Y_%H:%M:%S")
-
-        # instantiate TensorBoard's SummaryWriter object to track training progress
-        comment = f'{run_id}_wet_test_{timestamp_tag}_calib_lr={calib_lr:.06f},sfm_lr={sfm_lr:.06f}_gi={global_iter_count}_ci={calib_iter_count}_si={sfm_iter_count}'
-        writer = SummaryWriter(comment=comment)
-
-        # initialize FaceCalibration's optimizer
-        # NOTE: 'gt' is a dictionary that holds ground truth camera matrix & ground truth 3D face landmark locations.
-        #       It's only used for error calculation so you can pass an empty dict and still run optimization algorithm
-
-        optim = Optimizer(center, gt={}, calib_lr=calib_lr, sfm_lr=sfm_lr, tb_writer=writer)
-        assert optim is not None
-
-        # load pre-trained weights
-        # legacy pre-trained model
-        # token = 'legacy_pre_trained_model/00_'
-
-        # tokens
-        tokens = [
-            'wet_pre_trained_model/00_',  # 1st WET trained model
-            '00_fw=1.00_sw=10.00_clr=0.001000_slr=0.001000_',  # best model according to TensorBoard (last iteration)
-            '00_fw=10.00_sw=10.00_clr=0.001000_slr=0.001000_',  # best model according to TensorBoard (manual trend analysis)
-        ]
-
-        PRE_TRAINED_MODEL_INDEX = 2
-
-        optim.load(tokens[PRE_TRAINED_MODEL_INDEX])
-        print('FaceCalibration\'s optimizer is ready to use')
-
-        # load face landmarks data from MediaPipe sample app
-        _, face_keypoints_list = load_wet_data(TEST_DATA)
-
-        # convert list of NumPy arrays to a tensor
-        face_keypoints_tensor = convert_keypoints_list_to_tensor(face_keypoints_list)
-        print(f'face_keypoints_tensor.shape: {face_keypoints_tensor.shape}')
-
-        # TODO: Enable to dump some test data
-        # torch.save(face_keypoints_tensor, 'x_wet.pt')
+    # the test data and the ground truth do not depend on the hyperparameters - load and convert
+    # them once instead of re-reading 100 .npy files for every grid combination
+
+    # load face landmarks data from MediaPipe sample app
+    face_keypoints_list = load_wet_data(TEST_DATA)
+
+    # convert list of NumPy arrays to a tensor
+    face_keypoints_tensor = convert_keypoints_list_to_tensor(face_keypoints_list)
+    print(f'face_keypoints_tensor.shape: {face_keypoints_tensor.shape}')
+
+    # TODO: Enable to dump some test data
+    # torch.save(face_keypoints_tensor, 'x_wet.pt')
+
+    # load GT camera parameters
+    K_gt = load_gt_camera_parameters(TEST_DATA)
+    assert K_gt is not None and K_gt.shape == (3, 3)
+    print(f'K_gt:\n{K_gt}')
+    f_gt = K_gt[0, 0]
+
+    # load pre-trained weights
+    # legacy pre-trained model
+    # token = 'legacy_pre_trained_model/00_'
+
+    # tokens
+    tokens = [
+        'wet_pre_trained_model/00_',  # 1st WET trained model
+        '00_fw=1.00_sw=10.00_clr=0.001000_slr=0.001000_',  # best model according to TensorBoard (last iteration)
+        '00_fw=10.00_sw=10.00_clr=0.001000_slr=0.001000_',  # best model according to TensorBoard (manual trend analysis)
+    ]
+
+    # the pre-trained checkpoints are the same for the whole grid - read and parse the .pt files
+    # once here and hand the state dicts to the runs instead of re-loading them from disk per run;
+    # every run evaluates all tokens, so comparing the models no longer needs a full grid re-run
+    # per hardcoded token index
+    model_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'model'))
+    token_states = [
+        (torch.load(model_path + os.sep + token + 'sfm_net.pt'),
+         torch.load(model_path + os.sep + token + 'calib_net.pt'))
+        for token in tokens
+    ]
 
-        # run FaceCalibration's optimizer to get camera matrix (K) and face location (S) prediction
-
-        # default used in paper
-        # SFM_LR = 6
-
-        # # experimental values
-        # # SFM_LR = 0.01
-        # SFM_LR = 0.001  # according to best training on TensorBoard
-        # CALIB_LR = 0.001  # according to best training on TensorBoard
-
-        # number of iterations for dual-optimization
-        # MAX_ITER = 25
-
-        if USE_OPTIMIZATION:
-            # optimize using Alternating Optimization (AO) approach - proven to be the best one according to paper
-
-            # TODO: Subject for removal
-            # set learning rate for optimizers
-            # optim.sfm_opt.param_groups[0]['lr'] = SFM_LR
-            # optim.calib_opt.param_groups[0]['lr'] = CALIB_LR
-
-            try:
-                S, K, R, T = optim.dualoptimization(
-                    face_keypoints_tensor,
-                    global_iter_count=global_iter_count,
-                    calib_iter_count=calib_iter_count,
-                    sfm_iter_count=sfm_iter_count
+    # test various settings of the optimizers to see what gives the best results on real data from a phone
+    # go through all permutations of the hyper parameters - the combinations are fully independent,
+    # so dispatch them across worker processes instead of running all 432 of them back to back
+    if USE_OPTIMIZATION and optuna is not None:
+        # with optuna available, let a TPE sampler pick the combinations instead of sweeping all
+        # of them - it typically matches the best exhaustive-grid f_error in a fraction of the
+        # runs; trials execute sequentially because the sampler proposes each new combination
+        # from the results of the finished ones
+        TPE_TRIAL_COUNT = 64
+
+        def objective(trial) -> float:
+            calib_lr = trial.suggest_categorical('calib_lr', CALIB_LRS)
+            sfm_lr = trial.suggest_categorical('sfm_lr', SFM_LRS)
+            global_iter_count = trial.suggest_categorical('global_iter_count', GLOBAL_ITER_COUNTS)
+            calib_iter_count = trial.suggest_categorical('calib_iter_count', CALIB_ITER_COUNTS)
+            sfm_iter_count = trial.suggest_categorical('sfm_iter_count', SFM_ITER_COUNTS)
+
+            result = run_one(
+                trial.number, calib_lr, sfm_lr, global_iter_count, calib_iter_count, sfm_iter_count,
+                face_keypoints_tensor, f_gt, center,
+                token_states,
+                use_optimization=True,
+            )
+            if result['f_error'] is None:
+                raise optuna.TrialPruned()
+            # the best f_error across the pre-trained tokens scores the combination
+            return float(result['f_error'])
+
+        study = optuna.create_study(direction='minimize', sampler=optuna.samplers.TPESampler())
+        study.optimize(objective, n_trials=TPE_TRIAL_COUNT)
+        print(f'best trial: {study.best_trial.number}, f_error: {study.best_value:.03f}, params: {study.best_params}')
+    elif USE_OPTIMIZATION:
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_grid_worker) as executor:
+            futures = [
+                executor.submit(
+                    run_one,
+                    run_id, calib_lr, sfm_lr, global_iter_count, calib_iter_count, sfm_iter_count,
+                    face_keypoints_tensor, f_gt, center,
+                    token_states,
+                    use_optimization=True,
                 )
-            except:
-                print("OOPS! SOMETHING WENT WRONG!")
-                continue
-
-            # TODO: verify if other optimization methods give better results
-            # # JO approach
-            # S,K,R,T = optim.jointoptimization(face_keypoints_tensor, max_iter=100)
-
-            # # SO approach
-            # S,K,R,T = optim.sequentialoptimization(face_keypoints_tensor)
+                for run_id, (calib_lr, sfm_lr, global_iter_count, calib_iter_count, sfm_iter_count)
+                in enumerate(product(*hparam_values))
+            ]
+
+            for future in as_completed(futures):
+                result = future.result()
+                if result['f_error'] is None:
+                    print(f"run {result['run_id']}: FAILED")
+                else:
+                    print(f"run {result['run_id']}: f_error: {result['f_error']:.03f}")
+    else:
+        # without the dual-optimization the prediction is a pure forward pass of the pre-trained
+        # nets - it does not depend on any of the swept hyperparameters, so evaluate each token
+        # once and only the per-combination TensorBoard logging remains
+        optim = Optimizer(center, gt={}, tb_writer=None)
+        print('FaceCalibration\'s optimizer is ready to use')
 
-            # AO approach
-            # S, K, R, T = optim.dualoptimization(face_keypoints_tensor, max_iter=5)
+        f_errors = []
+        for token_index, (sfm_state, calib_state) in enumerate(token_states):
+            optim.sfm_net.load_state_dict(sfm_state)
+            optim.calib_net.load_state_dict(calib_state)
 
-        else:
-            # run without optimization
             K = optim.predict_intrinsic(face_keypoints_tensor)
             assert len(K.shape) == 3 and K.shape[0] == face_keypoints_tensor.shape[0] and K.shape[1:] == (3, 3)
             S = optim.get_shape(face_keypoints_tensor)
             assert len(S.shape) == 3 and S.shape[0] == face_keypoints_tensor.shape[0] and S.shape[1:] == (68, 3)
 
-        # get predicted camera's intrinsics by averaging predictions based on all processed data frames
-        f = torch.mean(K[:, 0, 0])
-        px = torch.mean(K[:, 0, 2])
-        py = torch.mean(K[:, 1, 2])
-
-        # get final prediction of camera matrix
-        K_avg = np.zeros((3, 3))
-        K_avg[0, 0] = f
-        K_avg[1, 1] = f
-        K_avg[0, 2] = px
-        K_avg[1, 2] = py
-        K_avg[2, 2] = 1.0
-
-        print(f'K_avg:\n{K_avg}')
-
-        # load GT camera parameters
-        K_gt = load_gt_camera_parameters(TEST_DATA)
-        assert K_gt is not None and K_gt.shape == (3, 3)
-        print(f'K_gt:\n{K_gt}')
-
-        # compare with what was calculated based on legacy camera calibration procedure using checkerboard
-        f_gt = K_gt[0, 0]
-        f_error = abs(f - f_gt) / f_gt
-        print(f'f_error: {f_error:.03f}')
-
-        writer.add_hparams(
-                {
-                    'calib_lr': calib_lr,
-                    'sfm_lr': sfm_lr,
-                    'global_iter_count': global_iter_count,
-                    'calib_iter_count': calib_iter_count,
-                    'sfm_iter_count': sfm_iter_count,
-                },
-                {
-                    'f_error': f_error,
-                }
-            )
+            f_errors.append(evaluate_predictions(K, f_gt))
+
+        # no per-step scalars are logged on this path, so one writer with per-run names is
+        # enough - constructing 432 SummaryWriters would create 432 event files just to hold
+        # a few hparams entries each
+        writer = SummaryWriter(comment='_wet_test_grid')
+
+        for run_id, (calib_lr, sfm_lr, global_iter_count, calib_iter_count, sfm_iter_count) in enumerate(product(*hparam_values)):
+            for token_index, f_error in enumerate(f_errors):
+                run_name = f'{run_id}_tok{token_index}_calib_lr={calib_lr:.06f},sfm_lr={sfm_lr:.06f}_gi={global_iter_count}_ci={calib_iter_count}_si={sfm_iter_count}'
+                writer.add_hparams(
+                    {
+                        'calib_lr': calib_lr,
+                        'sfm_lr': sfm_lr,
+                        'global_iter_count': global_iter_count,
+                        'calib_iter_count': calib_iter_count,
+                        'sfm_iter_count': sfm_iter_count,
+                        'token': token_index,
+                    },
+                    {
+                        'f_error': f_error,
+                    },
+                    run_name=run_name
+                )
 
 
 if __name__ == '__main__':